@@ -17,8 +17,7 @@ load_dotenv()
 from src.streamlit_utils import (
     format_severity_with_color,
     format_issue_for_display,
-    group_issues_by_severity,
-    group_issues_by_category,
+    group_issues,
     generate_summary_dict,
     get_quality_score_color,
     validate_code_input,
@@ -257,10 +256,9 @@ if review_button:
                 
                 # Tabs for different views
                 tab1, tab2, tab3 = st.tabs(["By Severity", "By Category", "All Issues"])
+                grouped_by_severity, grouped_by_category = group_issues(result.issues)
                 
                 with tab1:
-                    grouped_by_severity = group_issues_by_severity(result.issues)
-                    
                     # Display issues in severity order
                     for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
                         if severity in grouped_by_severity:
@@ -278,8 +276,6 @@ if review_button:
                                         st.caption(f"Rule ID: {issue.rule_id}")
                 
                 with tab2:
-                    grouped_by_category = group_issues_by_category(result.issues)
-                    
                     for category, issues in grouped_by_category.items():
                         st.subheader(f"{category.value.title()} ({len(issues)} issues)")
                         
@@ -315,7 +311,9 @@ if review_button:
                 """)
                 
                 with st.spinner("🤖 Generating Copilot prompts..."):
-                    prompt_result = generate_copilot_prompts(result, language=language)
+                    prompt_result = generate_copilot_prompts(
+                        result, language=language, api_key=api_key
+                    )
                 
                 if prompt_result and prompt_result.has_prompts():
                     # Store prompts in session state for export
@@ -4,8 +4,10 @@ Data models for code parsing and analysis.
 These Pydantic models provide type-safe representations of
 parsed code and its metadata for the code review system.
 """
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import ast
+import sys
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, Field, field_validator, ConfigDict, PrivateAttr
 
 
 class CodeMetadata(BaseModel):
@@ -43,6 +45,12 @@ class CodeMetadata(BaseModel):
         default=0, ge=0,
         description="Number of actual code lines (excluding comments/blanks)"
     )
+    
+    @field_validator('function_names', 'class_names')
+    @classmethod
+    def intern_names(cls, v: List[str]) -> List[str]:
+        """Intern identifier names so repeats (e.g. __init__) share storage."""
+        return [sys.intern(name) for name in v]
 
 
 class ParsedCode(BaseModel):
@@ -77,6 +85,11 @@ class ParsedCode(BaseModel):
         default="1.0.0", description="Version of the parser used"
     )
     
+    # Cached (source, tree) pair so the content is parsed once for all reviewers
+    _ast_cache: Optional[Tuple[str, Optional[ast.Module]]] = PrivateAttr(default=None)
+    # Cached (source, lines) pair shared by the line-based reviewers
+    _lines_cache: Optional[Tuple[str, Tuple[str, ...]]] = PrivateAttr(default=None)
+    
     @field_validator('language')
     @classmethod
     def validate_language(cls, v: str) -> str:
@@ -92,6 +105,39 @@ class ParsedCode(BaseModel):
         """
         return not self.has_syntax_errors
     
+    def get_ast(self) -> Optional[ast.Module]:
+        """
+        Parse the content as Python, caching the tree for later callers.
+        
+        The cache is tied to the current content, so reassigning
+        ``content`` triggers a fresh parse.
+        
+        Returns:
+            ast.Module, or None if the content is not valid Python
+        """
+        if self._ast_cache is None or self._ast_cache[0] is not self.content:
+            try:
+                tree = ast.parse(self.content)
+            except SyntaxError:
+                tree = None
+            self._ast_cache = (self.content, tree)
+        return self._ast_cache[1]
+    
+    def get_lines(self) -> Tuple[str, ...]:
+        """
+        Split the content into lines, caching the result for later callers.
+        
+        Splits on '\\n' only (not str.splitlines), so numbering matches the
+        line numbers ast reports even when the source contains form feeds
+        or other characters splitlines() treats as line breaks.
+        
+        Returns:
+            Tuple of lines, without their '\\n' terminators
+        """
+        if self._lines_cache is None or self._lines_cache[0] is not self.content:
+            self._lines_cache = (self.content, tuple(self.content.split('\n')))
+        return self._lines_cache[1]
+    
     def get_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the parsed code.
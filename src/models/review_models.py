@@ -4,7 +4,7 @@ Data models for code review results and issues.
 These Pydantic models represent the output of the code review process,
 including issues found, severity levels, and aggregated results.
 """
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
@@ -120,6 +120,10 @@ class ReviewResult(BaseModel):
     review_timestamp: Optional[str] = Field(
         default=None, description="ISO timestamp of when review was performed"
     )
+    completed: bool = Field(
+        default=True,
+        description="False if the reviewer could not finish (e.g. its API call failed)"
+    )
     
     @field_validator('quality_score')
     @classmethod
@@ -155,6 +159,18 @@ class ReviewResult(BaseModel):
         self.quality_score = self.calculate_quality_score()
         self.passed = not self.has_critical_issues()
     
+    def extend_issues(self, issues: Iterable[ReviewIssue]) -> None:
+        """
+        Add several issues without updating statistics.
+        
+        Call update_statistics() once afterwards; this avoids recounting
+        after every issue when results are collected in bulk.
+        
+        Args:
+            issues: The ReviewIssues to add
+        """
+        self.issues.extend(issues)
+    
     def has_critical_issues(self) -> bool:
         """Check if there are any critical issues."""
         return self.critical_count > 0
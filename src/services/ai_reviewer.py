@@ -7,7 +7,6 @@ context-aware code reviews that complement rule-based reviewers.
 import os
 import json
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 from openai import OpenAI
 from openai.types.chat import ChatCompletion
 from src.services.review_engine import ReviewStrategy
@@ -19,6 +18,10 @@ from src.models.review_models import ReviewResult, ReviewIssue, Severity, IssueC
 class AIReviewer(ReviewStrategy):
     """AI-powered code reviewer using OpenAI's GPT models."""
     
+    # The review is one network round trip, which ReviewEngine overlaps
+    # with the local reviewers
+    io_bound = True
+    
     DEFAULT_SYSTEM_PROMPT = """You are an expert code reviewer. Analyze code for bugs, \
 security issues, performance problems, and best practices violations.
 
@@ -73,7 +76,7 @@ Do not include any text before or after the JSON."""
         """Review code using OpenAI's AI models."""
         result = ReviewResult(
             reviewer_name="AIReviewer",
-            review_timestamp=datetime.now().isoformat()
+            review_timestamp=self._review_timestamp()
         )
         
         # Skip if code has syntax errors
@@ -107,9 +110,7 @@ Do not include any text before or after the JSON."""
             self._track_usage(response)
             
             # Parse AI response into issues
-            issues = self._parse_ai_response(response)
-            for issue in issues:
-                result.add_issue(issue)
+            result.extend_issues(self._parse_ai_response(response))
         
         except Exception as e:
             # Handle API errors gracefully
@@ -120,6 +121,9 @@ Do not include any text before or after the JSON."""
                 suggestion="Check API key, network connection, or try again later",
                 rule_id="AI999"
             ))
+            # A failed call says nothing about the code; mark the run
+            # incomplete so it is not cached
+            result.completed = False
         
         result.update_statistics()
         
@@ -172,6 +172,15 @@ Keep prompts concise but comprehensive (2-4 sentences)."""
         
         return ", ".join(parts)
     
+    def _format_issue_detail(self, issue: ReviewIssue) -> str:
+        """Format a single issue as a bullet line for the user prompt."""
+        detail = f"- {issue.severity.value.upper()}: {issue.message}"
+        if issue.line_number:
+            detail += f" (line {issue.line_number})"
+        if issue.suggestion:
+            detail += f"\n  Suggestion: {issue.suggestion}"
+        return detail
+    
     def _generate_prompt_for_category(
         self, category: IssueCategory, issues: List[ReviewIssue], language: str
     ) -> PromptSuggestion:
@@ -187,19 +196,8 @@ Keep prompts concise but comprehensive (2-4 sentences)."""
             PromptSuggestion with generated prompt text
         """
         # Build context about the issues
-        issue_details = []
-        line_references = []
-        
-        for issue in issues:
-            detail = f"- {issue.severity.value.upper()}: {issue.message}"
-            if issue.line_number:
-                detail += f" (line {issue.line_number})"
-                line_references.append(issue.line_number)
-            if issue.suggestion:
-                detail += f"\n  Suggestion: {issue.suggestion}"
-            issue_details.append(detail)
-        
-        issues_text = "\n".join(issue_details)
+        issues_text = "\n".join(self._format_issue_detail(issue) for issue in issues)
+        line_references = {issue.line_number for issue in issues if issue.line_number}
         
         # Build user prompt
         user_prompt = f"""Generate a GitHub Copilot prompt to fix the \
@@ -240,5 +238,5 @@ GitHub Copilot."""
             prompt_text=prompt_text,
             issue_count=len(issues),
             severity_summary=severity_summary,
-            line_references=sorted(set(line_references))
+            line_references=sorted(line_references)
         )
@@ -0,0 +1,132 @@
+"""
+Review Cache Service.
+
+Persists ReviewResult objects in a SQLite database keyed by a SHA-256
+digest of the reviewed content, so re-reviewing unchanged code (Streamlit
+re-runs, repeated CI runs) skips parsing and every reviewer. Entries
+expire after max_age seconds and are pruned on write, so the database
+does not grow without bound.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+from pydantic import ValidationError
+from src.models.review_models import ReviewResult
+
+
+class ReviewCache:
+    """
+    SQLite-backed cache mapping a content digest to a ReviewResult.
+    
+    Usage:
+        cache = ReviewCache(".review_cache.db")
+        key = ReviewCache.make_key(code, "python")
+        result = cache.get(key)
+        if result is None:
+            result = engine.review(parsed_code)
+            cache.put(key, result)
+    """
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS review_cache (
+            content_sha256 TEXT PRIMARY KEY,
+            result_json TEXT NOT NULL,
+            ts REAL NOT NULL
+        )
+    """
+    _INDEX = "CREATE INDEX IF NOT EXISTS review_cache_ts ON review_cache (ts)"
+    
+    # One week: long enough to cover repeated runs over a working copy
+    DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+    
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Filesystem path of the SQLite database (":memory:" allowed)
+            max_age: Seconds an entry stays valid; older entries miss and
+                are deleted on the next put()
+        """
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.execute(self._INDEX)
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(content: str, language: str, context: str = "") -> str:
+        """
+        Build a cache key for a piece of code.
+        
+        Args:
+            content: Source code being reviewed
+            language: Programming language of the code
+            context: Extra data the result depends on (e.g. serialized config)
+        
+        Returns:
+            Hex SHA-256 digest identifying the review
+        """
+        digest = hashlib.sha256()
+        for part in (language, context, content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[ReviewResult]:
+        """
+        Look up a cached review result.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            The cached ReviewResult, or None on a miss, expired or unreadable entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result_json FROM review_cache WHERE content_sha256 = ? AND ts >= ?",
+                (key, time.time() - self.max_age)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        try:
+            return ReviewResult.model_validate_json(row[0])
+        except ValidationError:
+            # Stale or corrupt entry (e.g. model changed); treat as a miss
+            return None
+    
+    def put(self, key: str, result: ReviewResult) -> None:
+        """
+        Store a review result, replacing any existing entry for the key.
+        
+        Expired entries are deleted in the same transaction.
+        
+        Args:
+            key: Cache key from make_key()
+            result: ReviewResult to store
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO review_cache (content_sha256, result_json, ts) "
+                "VALUES (?, ?, ?)",
+                (key, result.model_dump_json(), now)
+            )
+            self._conn.execute(
+                "DELETE FROM review_cache WHERE ts < ?", (now - self.max_age,)
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
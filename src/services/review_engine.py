@@ -10,14 +10,78 @@ Design Patterns:
 - Template Method: Common review workflow
 """
 import ast
+import json
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime
 from src.models.code_models import ParsedCode
 from src.models.review_models import ReviewResult, ReviewIssue, Severity, IssueCategory
 
 
+# Per-line patterns, compiled once at import instead of on every line
+_ASSIGN_RE = re.compile(r'\w=[^=]')
+_OP_RE = re.compile(r'\w[+\-*/]\w')
+_SQL_PERCENT_RE = re.compile(r'(select|insert|update|delete).*%s', re.IGNORECASE)
+_SQL_FORMAT_RE = re.compile(r'\.format\(', re.IGNORECASE)
+
+# Rank of each severity for min_severity filtering (higher is more severe)
+_SEVERITY_RANK = {
+    Severity.INFO: 0,
+    Severity.LOW: 1,
+    Severity.MEDIUM: 2,
+    Severity.HIGH: 3,
+    Severity.CRITICAL: 4,
+}
+
+# Naming-convention patterns used by StyleReviewer's helpers
+_SNAKE_CASE_RE = re.compile(r'^[a-z_][a-z0-9_]*$')
+_PASCAL_CASE_RE = re.compile(r'^[A-Z][a-zA-Z0-9]*$')
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+
+def _may_contain(content: str, *words: str) -> bool:
+    """
+    Cheap text test for whether source can mention any of the given names.
+    
+    Lets reviewers skip AST passes over code that cannot contain what they
+    look for. Non-ASCII source always passes, since Python NFKC-normalizes
+    identifiers (e.g. a fullwidth "ｅval" is eval).
+    """
+    return not content.isascii() or any(word in content for word in words)
+
+
+class _DefinitionVisitor(ast.NodeVisitor):
+    """
+    Collects FunctionDef and ClassDef nodes in source order.
+    
+    Definitions can only appear in statement lists, so only those fields
+    are descended into; expression subtrees (Expr, Assign, Return values,
+    decorators, annotations) are never visited.
+    """
+    
+    # Ordered so that definitions come out in source order (try: body,
+    # handlers, orelse, finalbody)
+    _STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+    
+    def __init__(self):
+        self.definitions: List[ast.AST] = []
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Record a function definition and look for nested definitions."""
+        self.definitions.append(node)
+        self.generic_visit(node)
+    
+    visit_ClassDef = visit_FunctionDef
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit child statements only, skipping expression subtrees."""
+        for field in self._STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+
 class ReviewStrategy(ABC):
     """
     Abstract base class for review strategies (Strategy Pattern).
@@ -26,6 +90,10 @@ class ReviewStrategy(ABC):
     specific types of code review (style, security, complexity, etc.).
     """
     
+    # Reviewers that spend their time waiting on I/O (e.g. a network API)
+    # set this so ReviewEngine runs them alongside the other reviewers
+    io_bound = False
+    
     @abstractmethod
     def review(self, parsed_code: ParsedCode) -> ReviewResult:
         """
@@ -37,6 +105,27 @@ class ReviewStrategy(ABC):
         Returns:
             ReviewResult with issues found
         """
+    
+    def uses_ast(self, parsed_code: ParsedCode) -> bool:
+        """
+        Whether review() will parse the code's AST.
+        
+        Lets ReviewEngine parse once up front before running reviewers
+        concurrently, and skip parsing when no reviewer needs the tree.
+        """
+        return False
+    
+    def _review_timestamp(self) -> Optional[str]:
+        """
+        Timestamp for this reviewer's result.
+        
+        ReviewEngine stamps the combined result itself and discards each
+        reviewer's result, so reviewers only stamp theirs when their
+        config sets "include_timestamps".
+        """
+        if getattr(self, "config", {}).get("include_timestamps", False):
+            return datetime.now().isoformat()
+        return None
 
 
 class StyleReviewer(ReviewStrategy):
@@ -69,22 +158,26 @@ class StyleReviewer(ReviewStrategy):
         """
         result = ReviewResult(
             reviewer_name="StyleReviewer",
-            review_timestamp=datetime.now().isoformat()
+            review_timestamp=self._review_timestamp()
         )
+        issues: List[ReviewIssue] = []
         
-        code = parsed_code.content
-        lines = code.split('\n')
+        lines = parsed_code.get_lines()
         
         # Check naming conventions (for Python)
-        if parsed_code.language == "python" and self.config.get("check_naming", True):
-            try:
-                tree = ast.parse(code)
+        if self.uses_ast(parsed_code):
+            tree = parsed_code.get_ast()
+            
+            # Can't check naming if syntax is invalid
+            if tree is not None:
+                visitor = _DefinitionVisitor()
+                visitor.visit(tree)
                 
-                for node in ast.walk(tree):
+                for node in visitor.definitions:
                     # Check function naming (should be snake_case)
                     if isinstance(node, ast.FunctionDef):
                         if not self._is_snake_case(node.name) and not node.name.startswith('_'):
-                            result.add_issue(ReviewIssue(
+                            issues.append(ReviewIssue(
                                 severity=Severity.LOW,
                                 category=IssueCategory.STYLE,
                                 message=f"Function '{node.name}' should use snake_case naming",
@@ -96,25 +189,24 @@ class StyleReviewer(ReviewStrategy):
                     # Check class naming (should be PascalCase)
                     elif isinstance(node, ast.ClassDef):
                         if not self._is_pascal_case(node.name):
-                            result.add_issue(ReviewIssue(
+                            issues.append(ReviewIssue(
                                 severity=Severity.LOW,
                                 category=IssueCategory.STYLE,
                                 message=f"Class '{node.name}' should use PascalCase naming",
                                 line_number=node.lineno,
                                 rule_id="STYLE002"
                             ))
-            
-            except SyntaxError:
-                # Can't check naming if syntax is invalid
-                pass
         
-        # Check spacing around operators
+        # Check spacing around operators (one pass covers both checks)
         if self.config.get("check_spacing", True):
+            assign_search = _ASSIGN_RE.search
+            op_search = _OP_RE.search
             for i, line in enumerate(lines, 1):
                 # Check for missing spaces around = in assignments (but not ==, !=, etc.)
-                # Pattern: variable=value (no spaces)
-                if re.search(r'\w=[^=]', line) and '==' not in line:
-                    result.add_issue(ReviewIssue(
+                # Pattern: variable=value (no spaces); the substring test is
+                # cheaper than the regex, so it goes first
+                if '==' not in line and assign_search(line):
+                    issues.append(ReviewIssue(
                         severity=Severity.INFO,
                         category=IssueCategory.STYLE,
                         message="Missing spaces around assignment operator",
@@ -125,8 +217,8 @@ class StyleReviewer(ReviewStrategy):
                     ))
                 
                 # Check for missing spaces around + - * /
-                if re.search(r'\w[+\-*/]\w', line):
-                    result.add_issue(ReviewIssue(
+                if op_search(line):
+                    issues.append(ReviewIssue(
                         severity=Severity.INFO,
                         category=IssueCategory.STYLE,
                         message="Missing spaces around operator",
@@ -136,34 +228,49 @@ class StyleReviewer(ReviewStrategy):
                         rule_id="STYLE004"
                     ))
         
-        # Check line length
+        # Check line length (lengths and max are computed in C, so files
+        # without long lines never enter the per-line Python loop)
         max_length = self.config.get("max_line_length", 100)
-        for i, line in enumerate(lines, 1):
-            if len(line) > max_length:
-                result.add_issue(ReviewIssue(
-                    severity=Severity.INFO,
-                    category=IssueCategory.STYLE,
-                    message=f"Line too long ({len(line)} > {max_length} characters)",
-                    line_number=i,
-                    rule_id="STYLE005"
-                ))
+        line_lengths = list(map(len, lines))
+        if max(line_lengths, default=0) > max_length:
+            for i, line_length in enumerate(line_lengths, 1):
+                if line_length > max_length:
+                    issues.append(ReviewIssue(
+                        severity=Severity.INFO,
+                        category=IssueCategory.STYLE,
+                        message=f"Line too long ({line_length} > {max_length} characters)",
+                        line_number=i,
+                        rule_id="STYLE005"
+                    ))
         
+        result.extend_issues(issues)
         result.update_statistics()
         return result
     
-    def _is_snake_case(self, name: str) -> bool:
+    def uses_ast(self, parsed_code: ParsedCode) -> bool:
+        """Only the naming check parses, and only if a definition can exist."""
+        return (
+            parsed_code.language == "python"
+            and self.config.get("check_naming", True)
+            and _may_contain(parsed_code.content, "def", "class")
+        )
+    
+    @staticmethod
+    def _is_snake_case(name: str) -> bool:
         """Check if name is in snake_case format."""
-        return bool(re.match(r'^[a-z_][a-z0-9_]*$', name))
+        return bool(_SNAKE_CASE_RE.match(name))
     
-    def _is_pascal_case(self, name: str) -> bool:
+    @staticmethod
+    def _is_pascal_case(name: str) -> bool:
         """Check if name is in PascalCase format."""
-        return bool(re.match(r'^[A-Z][a-zA-Z0-9]*$', name))
+        return bool(_PASCAL_CASE_RE.match(name))
     
-    def _to_snake_case(self, name: str) -> str:
+    @staticmethod
+    def _to_snake_case(name: str) -> str:
         """Convert name to snake_case."""
         # Insert underscore before uppercase letters
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = _CAMEL_WORD_RE.sub(r'\1_\2', name)
+        return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
 
 class ComplexityReviewer(ReviewStrategy):
@@ -197,67 +304,101 @@ class ComplexityReviewer(ReviewStrategy):
         """
         result = ReviewResult(
             reviewer_name="ComplexityReviewer",
-            review_timestamp=datetime.now().isoformat()
+            review_timestamp=self._review_timestamp()
         )
+        issues: List[ReviewIssue] = []
         
         # For Python, analyze AST to calculate complexity per function
-        if parsed_code.language == "python":
-            try:
-                tree = ast.parse(parsed_code.content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        complexity = self._calculate_function_complexity(node)
-                        
-                        if complexity > self.max_complexity:
-                            severity = (
-                                Severity.MEDIUM 
-                                if complexity <= self.max_complexity * 1.5 
-                                else Severity.HIGH
-                            )
-                            result.add_issue(ReviewIssue(
-                                severity=severity,
-                                category=IssueCategory.COMPLEXITY,
-                                message=(
-                                    f"Function '{node.name}' has high "
-                                    f"cyclomatic complexity: {complexity}"
-                                ),
-                                line_number=node.lineno,
-                                suggestion=(
-                                    f"Consider refactoring to reduce complexity "
-                                    f"(max: {self.max_complexity})"
-                                ),
-                                rule_id="COMPLEXITY001"
-                            ))
+        if self.uses_ast(parsed_code):
+            tree = parsed_code.get_ast()
             
-            except SyntaxError:
-                # Can't check complexity if syntax is invalid
-                pass
-        
+            # Can't check complexity if syntax is invalid
+            if tree is not None:
+                for node, complexity in self._calculate_function_complexities(tree):
+                    if complexity > self.max_complexity:
+                        severity = (
+                            Severity.MEDIUM 
+                            if complexity <= self.max_complexity * 1.5 
+                            else Severity.HIGH
+                        )
+                        issues.append(ReviewIssue(
+                            severity=severity,
+                            category=IssueCategory.COMPLEXITY,
+                            message=(
+                                f"Function '{node.name}' has high "
+                                f"cyclomatic complexity: {complexity}"
+                            ),
+                            line_number=node.lineno,
+                            suggestion=(
+                                f"Consider refactoring to reduce complexity "
+                                f"(max: {self.max_complexity})"
+                            ),
+                            rule_id="COMPLEXITY001"
+                        ))
+        
+        result.extend_issues(issues)
         result.update_statistics()
         return result
     
-    def _calculate_function_complexity(self, node: ast.FunctionDef) -> int:
+    def uses_ast(self, parsed_code: ParsedCode) -> bool:
+        """Python code is parsed only if it can contain a function."""
+        return parsed_code.language == "python" and _may_contain(parsed_code.content, "def")
+    
+    def _calculate_function_complexities(
+        self, tree: ast.AST
+    ) -> List[Tuple[ast.FunctionDef, int]]:
         """
-        Calculate cyclomatic complexity for a function.
+        Calculate cyclomatic complexity for every function in a tree.
+        
+        Complexity = 1 + number of decision points in the function
+        (nested functions included). Decision points are summed bottom-up
+        in one depth-first pass, so a nested function's subtree is visited
+        once rather than once per enclosing function.
+        
+        Each subtree's running total is kept on the traversal stack rather
+        than keyed by node: CPython shares a single ast.Load/ast.Store
+        instance across the whole tree, so nodes are not unique.
+        
+        Returns:
+            (function node, complexity) pairs in source order
+        """
+        functions = []
+        # Frames are [node, unvisited children, decision points so far]
+        stack = [[tree, ast.iter_child_nodes(tree), self._decision_points(tree)]]
+        
+        while stack:
+            frame = stack[-1]
+            child = next(frame[1], None)
+            if child is not None:
+                stack.append(
+                    [child, ast.iter_child_nodes(child), self._decision_points(child)]
+                )
+                continue
+        
+            node, _, points = stack.pop()
+            if stack:
+                stack[-1][2] += points
+            if isinstance(node, ast.FunctionDef):
+                functions.append((node, 1 + points))
+        
+        functions.sort(key=lambda item: (item[0].lineno, item[0].col_offset))
+        return functions
+    
+    def _decision_points(self, node: ast.AST) -> int:
+        """
+        Count decision points contributed by a single node.
         
-        Complexity = 1 + number of decision points
         Decision points: if, while, for, except, and, or
         """
-        complexity = 1
-        
-        for child in ast.walk(node):
-            # Count decision points
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                # and/or operators add to complexity
-                complexity += len(child.values) - 1
-            elif isinstance(child, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
-                # Comprehensions with conditions add complexity
-                complexity += sum(1 for gen in child.generators for _ in gen.ifs)
-        
-        return complexity
+        if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
+            return 1
+        if isinstance(node, ast.BoolOp):
+            # and/or operators add to complexity
+            return len(node.values) - 1
+        if isinstance(node, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
+            # Comprehensions with conditions add complexity
+            return sum(len(gen.ifs) for gen in node.generators)
+        return 0
 
 
 class SecurityReviewer(ReviewStrategy):
@@ -288,6 +429,22 @@ class SecurityReviewer(ReviewStrategy):
         ),
         (r'(?i)sk-[a-zA-Z0-9]{20,}', 'OpenAI API key'),
     ]
+    _COMPILED_SECRETS = [
+        (re.compile(pattern), secret_type)
+        for pattern, secret_type in SECRET_PATTERNS
+    ]
+    # All patterns as one alternation: a single scan tells whether any of
+    # them can match a line before each is run to report every hit. Global
+    # flags are only allowed at the start of a pattern, so each (?i) is
+    # stripped here and applied to the alternation as a whole
+    _ANY_SECRET_RE = re.compile(
+        "|".join(f"(?:{pattern.removeprefix('(?i)')})" for pattern, _ in SECRET_PATTERNS),
+        re.IGNORECASE
+    )
+    
+    # Literals at least one of which every secret pattern requires; ASCII
+    # lines without any of them (lowercased) cannot match and skip the regexes
+    _SECRET_LITERALS = ("api", "pass", "pwd", "secret", "token", "access", "sk-")
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize SecurityReviewer with optional configuration."""
@@ -305,18 +462,28 @@ class SecurityReviewer(ReviewStrategy):
         """
         result = ReviewResult(
             reviewer_name="SecurityReviewer",
-            review_timestamp=datetime.now().isoformat()
+            review_timestamp=self._review_timestamp()
         )
+        issues: List[ReviewIssue] = []
         
-        code = parsed_code.content
-        lines = code.split('\n')
+        lines = parsed_code.get_lines()
         
         # Check for hardcoded secrets
         for i, line in enumerate(lines, 1):
-            for pattern, secret_type in self.SECRET_PATTERNS:
-                matches = re.finditer(pattern, line)
+            # Non-ASCII lines bypass the literal test: re.IGNORECASE matches
+            # characters that no str case mapping folds to ASCII (dotless
+            # "ı" matches "i"), so only the regex can rule them out
+            if line.isascii():
+                lowered = line.lower()
+                if not any(literal in lowered for literal in self._SECRET_LITERALS):
+                    continue
+            if not self._ANY_SECRET_RE.search(line):
+                continue
+            
+            for pattern, secret_type in self._COMPILED_SECRETS:
+                matches = pattern.finditer(line)
                 for _ in matches:
-                    result.add_issue(ReviewIssue(
+                    issues.append(ReviewIssue(
                         severity=Severity.CRITICAL,
                         category=IssueCategory.SECURITY,
                         message=f"Hardcoded {secret_type} detected",
@@ -330,16 +497,17 @@ class SecurityReviewer(ReviewStrategy):
                     ))
         
         # Check for dangerous Python functions (if Python code)
-        if parsed_code.language == "python":
-            try:
-                tree = ast.parse(code)
-                
+        if self.uses_ast(parsed_code):
+            tree = parsed_code.get_ast()
+            
+            # Can't check AST if syntax is invalid
+            if tree is not None:
                 for node in ast.walk(tree):
                     # Check for eval() or exec()
                     if isinstance(node, ast.Call):
                         if isinstance(node.func, ast.Name):
                             if node.func.id in ('eval', 'exec'):
-                                result.add_issue(ReviewIssue(
+                                issues.append(ReviewIssue(
                                     severity=Severity.HIGH,
                                     category=IssueCategory.SECURITY,
                                     message=f"Dangerous use of {node.func.id}() function",
@@ -350,16 +518,17 @@ class SecurityReviewer(ReviewStrategy):
                                     ),
                                     rule_id="SEC002"
                                 ))
-            
-            except SyntaxError:
-                # Can't check AST if syntax is invalid
-                pass
         
         # Check for SQL injection patterns (basic)
         for i, line in enumerate(lines, 1):
+            # Cheap substring check first; most lines have no formatting at all
+            folded = line.casefold()
+            if '%s' not in folded and '.format(' not in folded:
+                continue
+            
             # Look for string formatting in SQL queries
-            if re.search(r'(?i)(select|insert|update|delete).*%s|\.format\(', line):
-                result.add_issue(ReviewIssue(
+            if _SQL_PERCENT_RE.search(line) or _SQL_FORMAT_RE.search(line):
+                issues.append(ReviewIssue(
                     severity=Severity.HIGH,
                     category=IssueCategory.SECURITY,
                     message="Potential SQL injection vulnerability",
@@ -369,8 +538,15 @@ class SecurityReviewer(ReviewStrategy):
                     rule_id="SEC003"
                 ))
         
+        result.extend_issues(issues)
         result.update_statistics()
         return result
+    
+    def uses_ast(self, parsed_code: ParsedCode) -> bool:
+        """Python code is parsed only if it can call eval() or exec()."""
+        return parsed_code.language == "python" and _may_contain(
+            parsed_code.content, "eval", "exec"
+        )
 
 
 class ReviewEngine:
@@ -387,10 +563,15 @@ class ReviewEngine:
         print(f"Quality Score: {result.quality_score}")
     """
     
+    # Part of every cache key: bump whenever a reviewer's rules change so
+    # results cached under the old rules are not served for unchanged code
+    RULES_VERSION = "1.0.0"
+    
     def __init__(
         self,
         reviewers: Optional[List[ReviewStrategy]] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        cache_path: Optional[str] = None
     ):
         """
         Initialize ReviewEngine.
@@ -398,8 +579,18 @@ class ReviewEngine:
         Args:
             reviewers: List of ReviewStrategy instances to use
             config: Optional configuration dictionary
+            cache_path: Optional SQLite path for caching results of unchanged code
         """
         self.config = config or {}
+        self.cache = None
+        if cache_path:
+            # sqlite3 is only loaded when caching is requested
+            from src.services.review_cache import ReviewCache
+            self.cache = ReviewCache(cache_path)
+        
+        # Resolve the severity threshold once rather than per issue
+        min_severity = self.config.get("min_severity")
+        self._min_rank = _SEVERITY_RANK[Severity(min_severity)] if min_severity else 0
         
         # If no reviewers provided, use default set
         if reviewers is None:
@@ -443,9 +634,96 @@ class ReviewEngine:
             ai_config["timeout"] = self.config["ai_timeout"]
         if "ai_system_prompt" in self.config:
             ai_config["system_prompt"] = self.config["ai_system_prompt"]
+        if "include_timestamps" in self.config:
+            ai_config["include_timestamps"] = self.config["include_timestamps"]
         
         return AIReviewer(config=ai_config)
     
+    def _cache_key(self, parsed_code: ParsedCode) -> str:
+        """Build the cache key for parsed code under this engine's setup."""
+        context = json.dumps(
+            {
+                "rules_version": self.RULES_VERSION,
+                "config": self.config,
+                "reviewers": [
+                    {
+                        "name": type(reviewer).__name__,
+                        "config": getattr(reviewer, "config", None),
+                        "max_complexity": getattr(reviewer, "max_complexity", None),
+                    }
+                    for reviewer in self.reviewers
+                ],
+            },
+            sort_keys=True,
+            default=str
+        )
+        return self.cache.make_key(parsed_code.content, parsed_code.language, context)
+    
+    def _run_reviewers(
+        self, parsed_code: ParsedCode
+    ) -> List[Tuple[List[ReviewIssue], bool]]:
+        """
+        Run all reviewers.
+        
+        Reviewers run concurrently only when one of them is I/O-bound (the
+        AI reviewer's API call overlaps the local checks) and
+        config["parallel"] is not disabled. The local reviewers are
+        GIL-bound, so threads would only add overhead for them alone.
+        
+        Returns:
+            Each reviewer's (filtered issues, completed) pair, in reviewer order
+        """
+        if (
+            not self.config.get("parallel", True)
+            or len(self.reviewers) < 2
+            or not any(reviewer.io_bound for reviewer in self.reviewers)
+        ):
+            return [self._collect_issues(reviewer, parsed_code) for reviewer in self.reviewers]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Parse up front so the threads share one cached tree, but only if
+        # some reviewer will use it. get_ast() only absorbs SyntaxError; any
+        # other parser failure (e.g. MemoryError on deeply nested input) is
+        # left for each reviewer to hit inside _collect_issues, as in a
+        # serial run
+        if any(reviewer.uses_ast(parsed_code) for reviewer in self.reviewers):
+            try:
+                parsed_code.get_ast()
+            except Exception:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=len(self.reviewers)) as executor:
+            return list(executor.map(
+                lambda reviewer: self._collect_issues(reviewer, parsed_code),
+                self.reviewers
+            ))
+    
+    def _collect_issues(
+        self, reviewer: ReviewStrategy, parsed_code: ParsedCode
+    ) -> Tuple[List[ReviewIssue], bool]:
+        """
+        Run one reviewer and return its issues at or above min_severity.
+        
+        Returns:
+            (issues, completed), where completed is False if the reviewer
+            raised or marked its result incomplete (e.g. an unreachable AI API)
+        """
+        try:
+            reviewer_result = reviewer.review(parsed_code)
+        except Exception:
+            # Log error but continue with other reviewers (resilience)
+            # In production, this would use proper logging
+            return [], False
+        
+        if not self._min_rank:
+            # No threshold configured: every issue is kept
+            return reviewer_result.issues, reviewer_result.completed
+        return [
+            issue for issue in reviewer_result.issues
+            if _SEVERITY_RANK[issue.severity] >= self._min_rank
+        ], reviewer_result.completed
+    
     def review(self, parsed_code: ParsedCode) -> ReviewResult:
         """
         Review the parsed code using all configured reviewers.
@@ -459,36 +737,31 @@ class ReviewEngine:
         Returns:
             ReviewResult with aggregated results from all reviewers
         """
+        # Unchanged code under the same setup reuses the stored result
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self._cache_key(parsed_code)
+            cached_result = self.cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+        
         # Create combined result
         combined_result = ReviewResult(
             reviewer_name="ReviewEngine",
             review_timestamp=datetime.now().isoformat()
         )
         
-        # Run each reviewer and collect issues
-        for reviewer in self.reviewers:
-            try:
-                reviewer_result = reviewer.review(parsed_code)
-                
-                # Add all issues from this reviewer to combined result
-                for issue in reviewer_result.issues:
-                    # Apply severity filtering if configured
-                    min_severity = self.config.get("min_severity")
-                    if min_severity:
-                        severity_order = ["info", "low", "medium", "high", "critical"]
-                        issue_idx = severity_order.index(issue.severity.value)
-                        min_idx = severity_order.index(min_severity)
-                        if issue_idx < min_idx:
-                            continue
-                    
-                    combined_result.add_issue(issue)
-                    
-            except Exception:
-                # Log error but continue with other reviewers (resilience)
-                # In production, this would use proper logging
-                continue
+        # Add each reviewer's issues in reviewer order; statistics are
+        # computed once after all reviewers have run
+        for issues, completed in self._run_reviewers(parsed_code):
+            combined_result.extend_issues(issues)
+            combined_result.completed = combined_result.completed and completed
         
         # Final statistics update (in case of any manual modifications)
         combined_result.update_statistics()
         
+        # A partial or failed run must not be replayed for unchanged code
+        if self.cache is not None and combined_result.completed:
+            self.cache.put(cache_key, combined_result)
+        
         return combined_result
@@ -6,21 +6,48 @@ used by the Streamlit UI, separated for testability.
 """
 import json
 import csv
+import operator
 import os
 from io import StringIO
 from typing import Dict, List, Tuple, Any, Optional
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup; json is the fallback
+    orjson = None
+
 from src.models.review_models import ReviewResult, ReviewIssue, Severity, IssueCategory
 from src.models.prompt_models import PromptSuggestion, PromptGenerationResult
-from src.services.review_engine import ReviewEngine
-from src.services.prompt_generator import PromptGenerator
 
 
 # ============================================================================
 # Severity Formatting
 # ============================================================================
 
+_SEVERITY_EMOJI: Dict[Severity, str] = {
+    Severity.CRITICAL: "🔴",
+    Severity.HIGH: "🟠",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🔵",
+    Severity.INFO: "⚪"
+}
+
+# Prebuilt "emoji LABEL" strings, one per severity
+_SEVERITY_LABELS: Dict[Severity, str] = {
+    severity: f"{emoji} {severity.value.upper()}"
+    for severity, emoji in _SEVERITY_EMOJI.items()
+}
+
+_SEVERITY_COLORS: Dict[Severity, str] = {
+    Severity.CRITICAL: "red",
+    Severity.HIGH: "orange",
+    Severity.MEDIUM: "yellow",
+    Severity.LOW: "blue",
+    Severity.INFO: "gray"
+}
+
+
 def format_severity_with_color(severity: Severity) -> str:
     """
     Format severity level with emoji and text.
@@ -31,16 +58,7 @@ def format_severity_with_color(severity: Severity) -> str:
     Returns:
         Formatted string with emoji and severity name
     """
-    emoji_map = {
-        Severity.CRITICAL: "🔴",
-        Severity.HIGH: "🟠",
-        Severity.MEDIUM: "🟡",
-        Severity.LOW: "🔵",
-        Severity.INFO: "⚪"
-    }
-    
-    emoji = emoji_map.get(severity, "⚫")
-    return f"{emoji} {severity.value.upper()}"
+    return _SEVERITY_LABELS.get(severity) or f"⚫ {severity.value.upper()}"
 
 
 def get_severity_color_map() -> Dict[Severity, str]:
@@ -48,15 +66,9 @@ def get_severity_color_map() -> Dict[Severity, str]:
     Get mapping of severity levels to color codes.
     
     Returns:
-        Dictionary mapping Severity to color string
+        Dictionary mapping Severity to color string (a copy, safe to modify)
     """
-    return {
-        Severity.CRITICAL: "red",
-        Severity.HIGH: "orange",
-        Severity.MEDIUM: "yellow",
-        Severity.LOW: "blue",
-        Severity.INFO: "gray"
-    }
+    return dict(_SEVERITY_COLORS)
 
 
 # ============================================================================
@@ -115,6 +127,27 @@ def group_issues_by_category(issues: List[ReviewIssue]) -> Dict[IssueCategory, L
     return dict(grouped)
 
 
+def group_issues(
+    issues: List[ReviewIssue]
+) -> Tuple[Dict[Severity, List[ReviewIssue]], Dict[IssueCategory, List[ReviewIssue]]]:
+    """
+    Group issues by severity and by category in a single pass.
+    
+    Args:
+        issues: List of ReviewIssue objects
+        
+    Returns:
+        Tuple of (issues by severity, issues by category), each matching the
+        output of group_issues_by_severity / group_issues_by_category
+    """
+    by_severity = defaultdict(list)
+    by_category = defaultdict(list)
+    for issue in issues:
+        by_severity[issue.severity].append(issue)
+        by_category[issue.category].append(issue)
+    return dict(by_severity), dict(by_category)
+
+
 # ============================================================================
 # Review Summary
 # ============================================================================
@@ -162,6 +195,12 @@ def get_quality_score_color(score: float) -> str:
 # Code Validation
 # ============================================================================
 
+# Languages accepted by the UI - no longer using CodeParser
+_SUPPORTED_LANGUAGES = frozenset(
+    ["python", "javascript", "typescript", "java", "cpp", "c", "go", "rust"]
+)
+
+
 def validate_code_input(code: str, max_lines: int = 10000) -> Tuple[bool, str]:
     """
     Validate code input from user.
@@ -173,10 +212,11 @@ def validate_code_input(code: str, max_lines: int = 10000) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not code or not code.strip():
+    # isspace() stops at the first non-blank character without copying the input
+    if not code or code.isspace():
         return False, "Code input is empty. Please provide code to review."
     
-    line_count = len(code.split('\n'))
+    line_count = code.count('\n') + 1
     if line_count > max_lines:
         return False, f"Code is too large ({line_count} lines). Maximum is {max_lines} lines."
     
@@ -193,9 +233,7 @@ def validate_language_selection(language: str) -> bool:
     Returns:
         True if language is supported
     """
-    # Support common languages - no longer using CodeParser
-    supported = ["python", "javascript", "typescript", "java", "cpp", "c", "go", "rust"]
-    return language.lower() in supported
+    return language.lower() in _SUPPORTED_LANGUAGES
 
 
 # ============================================================================
@@ -217,6 +255,7 @@ def run_review(code: str, language: str, config: Dict[str, Any]) -> Optional[Rev
     try:
         # Create a simple ParsedCode object without using CodeParser
         from src.models.code_models import ParsedCode, CodeMetadata
+        from src.services.review_engine import ReviewEngine
         
         # Create basic metadata
         lines = code.split('\n')
@@ -247,6 +286,20 @@ def run_review(code: str, language: str, config: Dict[str, Any]) -> Optional[Rev
 # Export Functionality
 # ============================================================================
 
+# Issue fields shared by the JSON and CSV exports, fetched in one C-level call
+_ISSUE_EXPORT_KEYS = ("severity", "category", "message", "line_number", "suggestion", "rule_id")
+_issue_export_fields = operator.attrgetter(
+    "severity.value", "category.value", "message", "line_number", "suggestion", "rule_id"
+)
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize data as 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
 def export_to_json(result: ReviewResult) -> str:
     """
     Export review result to JSON string.
@@ -259,15 +312,8 @@ def export_to_json(result: ReviewResult) -> str:
     """
     data = {
         "issues": [
-            {
-                "severity": issue.severity.value,
-                "category": issue.category.value,
-                "message": issue.message,
-                "line_number": issue.line_number,
-                "suggestion": issue.suggestion,
-                "rule_id": issue.rule_id
-            }
-            for issue in result.issues
+            dict(zip(_ISSUE_EXPORT_KEYS, fields))
+            for fields in map(_issue_export_fields, result.issues)
         ],
         "quality_score": result.quality_score,
         "total_issues": result.total_issues,
@@ -275,7 +321,7 @@ def export_to_json(result: ReviewResult) -> str:
         "reviewer_name": result.reviewer_name
     }
     
-    return json.dumps(data, indent=2)
+    return _dumps_indented(data)
 
 
 def export_to_markdown(result: ReviewResult) -> str:
@@ -288,7 +334,7 @@ def export_to_markdown(result: ReviewResult) -> str:
     Returns:
         Markdown string
     """
-    md = f"""# Code Review Report
+    parts = [f"""# Code Review Report
 
 ## Summary
 - **Quality Score**: {result.quality_score}/100
@@ -304,18 +350,22 @@ def export_to_markdown(result: ReviewResult) -> str:
 
 ## Detailed Issues
 
-"""
+"""]
     
+    # One fragment per issue, joined once; repeated += is quadratic for large reports
+    append = parts.append
     for i, issue in enumerate(result.issues, 1):
-        severity_color = format_severity_with_color(issue.severity)
-        md += f"### {i}. {severity_color} - {issue.category.value.title()}\n"
-        md += f"**Line**: {issue.line_number or 'N/A'}\n\n"
-        md += f"**Message**: {issue.message}\n\n"
-        if issue.suggestion:
-            md += f"**Suggestion**: {issue.suggestion}\n\n"
-        md += "---\n\n"
+        suggestion = issue.suggestion
+        suggestion_md = f"**Suggestion**: {suggestion}\n\n" if suggestion else ""
+        append(
+            f"### {i}. {format_severity_with_color(issue.severity)} - "
+            f"{issue.category.value.title()}\n"
+            f"**Line**: {issue.line_number or 'N/A'}\n\n"
+            f"**Message**: {issue.message}\n\n"
+            f"{suggestion_md}---\n\n"
+        )
     
-    return md
+    return "".join(parts)
 
 
 def export_to_csv(result: ReviewResult) -> str:
@@ -334,16 +384,12 @@ def export_to_csv(result: ReviewResult) -> str:
     # Header
     writer.writerow(["Severity", "Category", "Line", "Message", "Suggestion", "Rule ID"])
     
-    # Data rows
-    for issue in result.issues:
-        writer.writerow([
-            issue.severity.value,
-            issue.category.value,
-            issue.line_number or "N/A",
-            issue.message,
-            issue.suggestion or "",
-            issue.rule_id or ""
-        ])
+    # Data rows, written in one batch
+    writer.writerows(
+        (severity, category, line_number or "N/A", message, suggestion or "", rule_id or "")
+        for severity, category, message, line_number, suggestion, rule_id
+        in map(_issue_export_fields, result.issues)
+    )
     
     return output.getvalue()
 
@@ -352,20 +398,47 @@ def export_to_csv(result: ReviewResult) -> str:
 # Configuration Helpers
 # ============================================================================
 
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "enable_style": True,
+    "enable_complexity": True,
+    "enable_security": True,
+    "enable_ai": False,
+    "max_complexity": 10
+}
+
+# Predefined review modes; unknown modes fall back to _DEFAULT_CONFIG
+_MODE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "quick": {
+        "enable_style": True,
+        "enable_complexity": True,
+        "enable_security": True,
+        "enable_ai": False
+    },
+    "standard": {
+        "enable_style": True,
+        "enable_complexity": True,
+        "enable_security": True,
+        "enable_ai": True,
+        "ai_model": "gpt-4o-mini"
+    },
+    "deep": {
+        "enable_style": False,
+        "enable_complexity": False,
+        "enable_security": False,
+        "enable_ai": True,
+        "ai_model": "gpt-4o"
+    }
+}
+
+
 def get_default_config() -> Dict[str, Any]:
     """
     Get default review configuration.
     
     Returns:
-        Default configuration dictionary
+        Default configuration dictionary (a copy, safe to modify)
     """
-    return {
-        "enable_style": True,
-        "enable_complexity": True,
-        "enable_security": True,
-        "enable_ai": False,
-        "max_complexity": 10
-    }
+    return dict(_DEFAULT_CONFIG)
 
 
 def build_config_from_ui_inputs(ui_inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -378,13 +451,8 @@ def build_config_from_ui_inputs(ui_inputs: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration dictionary for ReviewEngine
     """
-    config = {}
-    
     # Copy all inputs to config
-    for key, value in ui_inputs.items():
-        config[key] = value
-    
-    return config
+    return dict(ui_inputs)
 
 
 def get_review_mode_config(mode: str) -> Dict[str, Any]:
@@ -395,33 +463,9 @@ def get_review_mode_config(mode: str) -> Dict[str, Any]:
         mode: Review mode ('quick', 'standard', 'deep')
         
     Returns:
-        Configuration dictionary
-    """
-    if mode == "quick":
-        return {
-            "enable_style": True,
-            "enable_complexity": True,
-            "enable_security": True,
-            "enable_ai": False
-        }
-    if mode == "standard":
-        return {
-            "enable_style": True,
-            "enable_complexity": True,
-            "enable_security": True,
-            "enable_ai": True,
-            "ai_model": "gpt-4o-mini"
-        }
-    if mode == "deep":
-        return {
-            "enable_style": False,
-            "enable_complexity": False,
-            "enable_security": False,
-            "enable_ai": True,
-            "ai_model": "gpt-4o"
-        }
-    
-    return get_default_config()
+        Configuration dictionary (a copy, safe to modify)
+    """
+    return dict(_MODE_CONFIGS.get(mode, _DEFAULT_CONFIG))
 
 
 # ============================================================================
@@ -456,8 +500,9 @@ def generate_copilot_prompts(
         return PromptGenerationResult(language=language)
     
     try:
-        # Create OpenAI client and generator
+        # Create OpenAI client and generator (openai is only loaded here)
         from openai import OpenAI
+        from src.services.prompt_generator import PromptGenerator
         client = OpenAI(api_key=api_key)
         generator = PromptGenerator(client=client)
         result = generator.generate(review_result, language=language)
@@ -471,6 +516,45 @@ def generate_copilot_prompts(
 # Prompt Formatting for UI
 # ============================================================================
 
+_CATEGORY_EMOJI: Dict[IssueCategory, str] = {
+    IssueCategory.SECURITY: "🔒",
+    IssueCategory.COMPLEXITY: "🔄",
+    IssueCategory.STYLE: "✨",
+    IssueCategory.PERFORMANCE: "⚡",
+    IssueCategory.BUG_RISK: "🐛",
+    IssueCategory.BEST_PRACTICES: "👍",
+    IssueCategory.DOCUMENTATION: "📝"
+}
+
+_CATEGORY_COLORS: Dict[IssueCategory, str] = {
+    IssueCategory.SECURITY: "red",
+    IssueCategory.BUG_RISK: "orange",
+    IssueCategory.COMPLEXITY: "blue",
+    IssueCategory.PERFORMANCE: "blue",
+    IssueCategory.STYLE: "gray",
+    IssueCategory.BEST_PRACTICES: "blue",
+    IssueCategory.DOCUMENTATION: "gray"
+}
+
+# Category display names, built once instead of per prompt ("best_practices"
+# -> "Best Practices" / "BEST PRACTICES" / "👍 Best Practices")
+_CATEGORY_TITLES: Dict[IssueCategory, str] = {
+    category: category.value.replace('_', ' ').title() for category in IssueCategory
+}
+_CATEGORY_UPPER: Dict[IssueCategory, str] = {
+    category: category.value.replace('_', ' ').upper() for category in IssueCategory
+}
+_CATEGORY_DISPLAY: Dict[IssueCategory, str] = {
+    category: f"{_CATEGORY_EMOJI[category]} {_CATEGORY_TITLES[category]}"
+    for category in IssueCategory
+}
+
+
+def _format_line_references(line_references: List[int]) -> str:
+    """Format line numbers as a comma-separated string, e.g. "3, 9, 12"."""
+    return ", ".join(map(str, line_references))
+
+
 def format_prompt_for_display(prompt: PromptSuggestion) -> Dict[str, Any]:
     """
     Format a single prompt suggestion for UI display.
@@ -481,13 +565,11 @@ def format_prompt_for_display(prompt: PromptSuggestion) -> Dict[str, Any]:
     Returns:
         Dictionary with formatted prompt data for display
     """
-    # Get category emoji
-    category_emoji = get_category_emoji(prompt.category)
-    category_display = f"{category_emoji} {prompt.category.value.replace('_', ' ').title()}"
+    category_display = _CATEGORY_DISPLAY[prompt.category]
     
     # Format line references
     if prompt.line_references:
-        lines_display = ", ".join(str(line) for line in prompt.line_references)
+        lines_display = _format_line_references(prompt.line_references)
     else:
         lines_display = "N/A"
     
@@ -517,6 +599,12 @@ def format_prompts_for_display(result: PromptGenerationResult) -> List[Dict[str,
 # Prompt Export
 # ============================================================================
 
+# Separators shared by the prompt exporters
+_TEXT_RULE = "=" * 80
+_TEXT_DIVIDER = "-" * 80
+_MD_DIVIDER = "---\n\n"
+
+
 def export_prompts_to_text(result: PromptGenerationResult) -> str:
     """
     Export prompts as plain text format.
@@ -530,23 +618,26 @@ def export_prompts_to_text(result: PromptGenerationResult) -> str:
     if not result.has_prompts():
         return "No prompts generated."
     
-    lines = ["=" * 80]
+    lines = [_TEXT_RULE]
     lines.append("GITHUB COPILOT PROMPTS")
     lines.append(f"Language: {result.language}")
-    lines.append("=" * 80)
+    lines.append(_TEXT_RULE)
     lines.append("")
     
+    # One multi-line block per prompt; the final join adds the newline between blocks
     for i, prompt in enumerate(result.prompts, 1):
-        lines.append(f"{i}. {prompt.category.value.replace('_', ' ').upper()}")
-        lines.append(f"   Issues: {prompt.issue_count} ({prompt.severity_summary})")
+        lines_line = ""
         if prompt.line_references:
-            lines.append(f"   Lines: {', '.join(str(line) for line in prompt.line_references)}")
-        lines.append("")
-        lines.append("   Prompt:")
-        lines.append(f"   {prompt.prompt_text}")
-        lines.append("")
-        lines.append("-" * 80)
-        lines.append("")
+            lines_line = f"   Lines: {_format_line_references(prompt.line_references)}\n"
+        lines.append(
+            f"{i}. {_CATEGORY_UPPER[prompt.category]}\n"
+            f"   Issues: {prompt.issue_count} ({prompt.severity_summary})\n"
+            f"{lines_line}\n"
+            "   Prompt:\n"
+            f"   {prompt.prompt_text}\n"
+            "\n"
+            f"{_TEXT_DIVIDER}\n"
+        )
     
     return "\n".join(lines)
 
@@ -576,7 +667,7 @@ def export_prompts_to_json(result: PromptGenerationResult) -> str:
         ]
     }
     
-    return json.dumps(data, indent=2)
+    return _dumps_indented(data)
 
 
 def export_prompts_to_markdown(result: PromptGenerationResult) -> str:
@@ -592,25 +683,28 @@ def export_prompts_to_markdown(result: PromptGenerationResult) -> str:
     if not result.has_prompts():
         return "# GitHub Copilot Prompts\n\nNo prompts generated."
     
-    md = "# GitHub Copilot Prompts\n\n"
-    md += f"**Language**: {result.language}\n\n"
-    md += f"**Total Prompts**: {len(result.prompts)}\n\n"
-    md += "---\n\n"
+    parts = [
+        "# GitHub Copilot Prompts\n\n"
+        f"**Language**: {result.language}\n\n"
+        f"**Total Prompts**: {len(result.prompts)}\n\n"
+        f"{_MD_DIVIDER}"
+    ]
     
+    # Collect fragments and join once; repeated += is quadratic in output size
+    append = parts.append
     for i, prompt in enumerate(result.prompts, 1):
-        category_emoji = get_category_emoji(prompt.category)
-        md += f"## {i}. {category_emoji} {prompt.category.value.replace('_', ' ').title()}\n\n"
-        md += f"**Issues Addressed**: {prompt.issue_count}\n\n"
-        md += f"**Severity**: {prompt.severity_summary}\n\n"
+        append(f"## {i}. {_CATEGORY_DISPLAY[prompt.category]}\n\n")
+        append(f"**Issues Addressed**: {prompt.issue_count}\n\n")
+        append(f"**Severity**: {prompt.severity_summary}\n\n")
         
         if prompt.line_references:
-            md += f"**Lines**: {', '.join(str(line) for line in prompt.line_references)}\n\n"
+            append(f"**Lines**: {_format_line_references(prompt.line_references)}\n\n")
         
-        md += "### Prompt\n\n"
-        md += f"```\n{prompt.prompt_text}\n```\n\n"
-        md += "---\n\n"
+        append("### Prompt\n\n")
+        append(f"```\n{prompt.prompt_text}\n```\n\n")
+        append(_MD_DIVIDER)
     
-    return md
+    return "".join(parts)
 
 
 # ============================================================================
@@ -636,18 +730,16 @@ def prepare_prompt_for_copy(
         return prompt.prompt_text
     
     # Include context for better results
-    context_parts = []
-    context_parts.append(f"Category: {prompt.category.value.replace('_', ' ').title()}")
-    context_parts.append(f"Issues: {prompt.issue_count} ({prompt.severity_summary})")
-    
+    lines_context = ""
     if prompt.line_references:
-        lines_str = ", ".join(str(line) for line in prompt.line_references)
-        context_parts.append(f"Lines: {lines_str}")
+        lines_context = f"Lines: {_format_line_references(prompt.line_references)}\n"
     
-    context_parts.append("")
-    context_parts.append(prompt.prompt_text)
-    
-    return "\n".join(context_parts)
+    return (
+        f"Category: {_CATEGORY_TITLES[prompt.category]}\n"
+        f"Issues: {prompt.issue_count} ({prompt.severity_summary})\n"
+        f"{lines_context}\n"
+        f"{prompt.prompt_text}"
+    )
 
 
 # ============================================================================
@@ -664,17 +756,11 @@ def get_category_emoji(category: IssueCategory) -> str:
     Returns:
         Emoji string
     """
-    emoji_map = {
-        IssueCategory.SECURITY: "🔒",
-        IssueCategory.COMPLEXITY: "🔄",
-        IssueCategory.STYLE: "✨",
-        IssueCategory.PERFORMANCE: "⚡",
-        IssueCategory.BUG_RISK: "🐛",
-        IssueCategory.BEST_PRACTICES: "👍",
-        IssueCategory.DOCUMENTATION: "📝"
-    }
-    
-    return emoji_map.get(category, "📌")
+    # Every IssueCategory has an entry, so the fallback is only for foreign values
+    try:
+        return _CATEGORY_EMOJI[category]
+    except KeyError:
+        return "📌"
 
 
 def get_category_color(category: IssueCategory) -> str:
@@ -687,17 +773,10 @@ def get_category_color(category: IssueCategory) -> str:
     Returns:
         Color string for UI styling
     """
-    color_map = {
-        IssueCategory.SECURITY: "red",
-        IssueCategory.BUG_RISK: "orange",
-        IssueCategory.COMPLEXITY: "blue",
-        IssueCategory.PERFORMANCE: "blue",
-        IssueCategory.STYLE: "gray",
-        IssueCategory.BEST_PRACTICES: "blue",
-        IssueCategory.DOCUMENTATION: "gray"
-    }
-    
-    return color_map.get(category, "gray")
+    try:
+        return _CATEGORY_COLORS[category]
+    except KeyError:
+        return "gray"
 
 
 def should_generate_prompts(has_api_key: bool, has_issues: bool) -> bool:
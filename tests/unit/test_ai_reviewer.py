@@ -6,7 +6,7 @@ to ensure proper integration and error handling.
 """
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from openai import OpenAI
+from openai import OpenAI, APITimeoutError
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion import Choice
 from openai.types import CompletionUsage
@@ -14,7 +14,7 @@ from openai.types import CompletionUsage
 from src.services.ai_reviewer import AIReviewer
 from src.services.review_engine import ReviewStrategy
 from src.models.code_models import ParsedCode, CodeMetadata
-from src.models.review_models import Severity, IssueCategory
+from src.models.review_models import Severity, IssueCategory, ReviewResult
 
 
 # ============================================================================
@@ -106,6 +106,11 @@ class TestAIReviewerInitialization:
         reviewer = AIReviewer(client=mock_openai_client)
         assert isinstance(reviewer, ReviewStrategy)
     
+    def test_ai_reviewer_is_io_bound(self, mock_openai_client):
+        """AIReviewer should be marked I/O-bound so ReviewEngine overlaps its API call."""
+        reviewer = AIReviewer(client=mock_openai_client)
+        assert reviewer.io_bound is True
+    
     def test_ai_reviewer_accepts_openai_client(self, mock_openai_client):
         """AIReviewer should accept OpenAI client via constructor."""
         reviewer = AIReviewer(client=mock_openai_client)
@@ -170,10 +175,23 @@ class TestAIReviewerBasicReview:
         reviewer = AIReviewer(client=mock_openai_client)
         result = reviewer.review(simple_parsed_code)
         
-        from src.models.review_models import ReviewResult
         assert isinstance(result, ReviewResult)
         assert result.reviewer_name == "AIReviewer"
     
+    def test_review_timestamp_is_opt_in(self, mock_openai_client, simple_parsed_code):
+        """Result should only be stamped when include_timestamps is set, like other reviewers."""
+        mock_openai_client.chat.completions.create.return_value = create_mock_response(
+            '{"issues": []}'
+        )
+        
+        plain = AIReviewer(client=mock_openai_client).review(simple_parsed_code)
+        stamped = AIReviewer(
+            client=mock_openai_client, config={"include_timestamps": True}
+        ).review(simple_parsed_code)
+        
+        assert plain.review_timestamp is None
+        assert stamped.review_timestamp is not None
+    
     def test_review_calls_openai_api(self, mock_openai_client, simple_parsed_code):
         """Review should call OpenAI chat completion API."""
         mock_response = create_mock_response('{"issues": []}')
@@ -470,7 +488,6 @@ class TestAIReviewerErrorHandling:
     
     def test_review_handles_timeout(self, mock_openai_client, simple_parsed_code):
         """Should handle API timeout gracefully."""
-        from openai import APITimeoutError
         mock_openai_client.chat.completions.create.side_effect = APITimeoutError("Timeout")
         
         reviewer = AIReviewer(client=mock_openai_client)
@@ -478,6 +495,8 @@ class TestAIReviewerErrorHandling:
         
         assert result.total_issues == 1
         assert "AI review failed" in result.issues[0].message
+        # A failed call must not be mistaken for a finished review
+        assert result.completed is False
 
 
 # ============================================================================
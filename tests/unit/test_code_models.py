@@ -1,6 +1,8 @@
 """
 Unit tests for code models (ParsedCode, CodeMetadata).
 """
+import ast
+import sys
 import pytest
 from pydantic import ValidationError
 from src.models.code_models import ParsedCode, CodeMetadata
@@ -30,6 +32,18 @@ class TestCodeMetadataValidation:
         """CodeMetadata should reject comment ratios above 1.0."""
         with pytest.raises(ValidationError):
             CodeMetadata(comment_ratio=1.5)
+    
+    def test_function_and_class_names_are_interned(self):
+        """CodeMetadata should intern identifier names."""
+        # Build names at runtime so they are not compile-time constants
+        name = "".join(["__in", "it__"])
+        class_name = "".join(["Foo", "Bar"])
+        assert name is not sys.intern(name) and class_name is not sys.intern(class_name)
+        metadata = CodeMetadata(function_names=[name], class_names=[class_name])
+        
+        assert metadata.function_names == ["__init__"]
+        assert metadata.function_names[0] is sys.intern("__init__")
+        assert metadata.class_names[0] is sys.intern("FooBar")
 
 
 class TestParsedCodeMethods:
@@ -88,3 +102,57 @@ class TestParsedCodeMethods:
         assert summary["classes"] == 1
         assert summary["complexity"] == 5.0
         assert summary["has_errors"] is False
+    
+    def test_get_ast_parses_once_and_caches(self):
+        """get_ast() should return the same tree object on repeated calls."""
+        parsed = ParsedCode(
+            content="def foo(): pass",
+            language="python",
+            metadata=CodeMetadata()
+        )
+        
+        tree = parsed.get_ast()
+        
+        assert isinstance(tree, ast.Module)
+        assert parsed.get_ast() is tree
+    
+    def test_get_ast_returns_none_on_syntax_error(self):
+        """get_ast() should return None when content is not valid Python."""
+        parsed = ParsedCode(
+            content="def foo(",
+            language="python",
+            metadata=CodeMetadata()
+        )
+        
+        assert parsed.get_ast() is None
+    
+    def test_get_ast_reparses_when_content_changes(self):
+        """get_ast() should not return a stale tree after content is replaced."""
+        parsed = ParsedCode(
+            content="def foo(): pass",
+            language="python",
+            metadata=CodeMetadata()
+        )
+        first = parsed.get_ast()
+        
+        parsed.content = "class Bar: pass"
+        second = parsed.get_ast()
+        
+        assert second is not first
+        assert isinstance(second.body[0], ast.ClassDef)
+    
+    def test_get_lines_splits_on_newline_only_and_caches(self):
+        """get_lines() should keep form feeds in-line and reuse the cached tuple."""
+        parsed = ParsedCode(
+            content="x = 1\n\x0cy = 2\n",
+            language="python",
+            metadata=CodeMetadata()
+        )
+        
+        lines = parsed.get_lines()
+        
+        assert lines == ("x = 1", "\x0cy = 2", "")
+        assert parsed.get_lines() is lines
+        
+        parsed.content = "z = 3"
+        assert parsed.get_lines() == ("z = 3",)
@@ -0,0 +1,127 @@
+"""
+Unit tests for ReviewCache.
+
+Tests the SQLite-backed review result cache used by ReviewEngine.
+"""
+import time
+import pytest
+from src.services.review_cache import ReviewCache
+from src.models.review_models import ReviewResult, ReviewIssue, Severity, IssueCategory
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """ReviewCache backed by a temporary database file."""
+    review_cache = ReviewCache(str(tmp_path / "cache.db"))
+    yield review_cache
+    review_cache.close()
+
+
+@pytest.fixture
+def sample_result():
+    """ReviewResult with a single issue."""
+    result = ReviewResult(reviewer_name="ReviewEngine")
+    result.add_issue(ReviewIssue(
+        severity=Severity.HIGH,
+        category=IssueCategory.SECURITY,
+        message="Dangerous use of eval() function",
+        line_number=3,
+        rule_id="SEC002"
+    ))
+    return result
+
+
+class TestReviewCacheKeys:
+    """Test cache key generation."""
+    
+    def test_make_key_is_deterministic(self):
+        """Same inputs should always produce the same key."""
+        assert ReviewCache.make_key("x = 1", "python") == ReviewCache.make_key("x = 1", "python")
+    
+    def test_make_key_depends_on_content_language_and_context(self):
+        """Changing any input should change the key."""
+        base = ReviewCache.make_key("x = 1", "python", "ctx")
+        
+        assert ReviewCache.make_key("x = 2", "python", "ctx") != base
+        assert ReviewCache.make_key("x = 1", "javascript", "ctx") != base
+        assert ReviewCache.make_key("x = 1", "python", "other") != base
+
+
+class TestReviewCacheStorage:
+    """Test storing and retrieving results."""
+    
+    def test_get_returns_none_on_miss(self, cache):
+        """Unknown keys should miss."""
+        assert cache.get(ReviewCache.make_key("x = 1", "python")) is None
+    
+    def test_put_then_get_round_trips_result(self, cache, sample_result):
+        """A stored result should come back with the same issues and statistics."""
+        key = ReviewCache.make_key("eval('1')", "python")
+        
+        cache.put(key, sample_result)
+        cached = cache.get(key)
+        
+        assert cached == sample_result
+        assert cached.issues[0].severity == Severity.HIGH
+    
+    def test_put_replaces_existing_entry(self, cache, sample_result):
+        """Storing under an existing key should overwrite it."""
+        key = ReviewCache.make_key("x = 1", "python")
+        cache.put(key, ReviewResult())
+        
+        cache.put(key, sample_result)
+        
+        assert cache.get(key).total_issues == 1
+    
+    def test_get_treats_unreadable_entry_as_miss(self, cache):
+        """Entries that no longer validate should be ignored."""
+        key = ReviewCache.make_key("x = 1", "python")
+        cache._conn.execute(
+            "INSERT INTO review_cache (content_sha256, result_json, ts) VALUES (?, ?, ?)",
+            (key, '{"quality_score": 500}', time.time())
+        )
+        
+        assert cache.get(key) is None
+    
+    def test_results_persist_across_instances(self, tmp_path, sample_result):
+        """A new cache on the same file should see earlier entries."""
+        path = str(tmp_path / "cache.db")
+        key = ReviewCache.make_key("eval('1')", "python")
+        writer = ReviewCache(path)
+        writer.put(key, sample_result)
+        writer.close()
+        
+        reader = ReviewCache(path)
+        
+        assert reader.get(key) == sample_result
+        reader.close()
+
+
+class TestReviewCacheExpiry:
+    """Test that entries expire and are pruned."""
+    
+    def test_get_treats_expired_entry_as_miss(self, tmp_path, sample_result):
+        """Entries older than max_age should miss."""
+        cache = ReviewCache(str(tmp_path / "cache.db"), max_age=60)
+        key = ReviewCache.make_key("eval('1')", "python")
+        cache._conn.execute(
+            "INSERT INTO review_cache (content_sha256, result_json, ts) VALUES (?, ?, ?)",
+            (key, sample_result.model_dump_json(), time.time() - 120)
+        )
+        
+        assert cache.get(key) is None
+        cache.close()
+    
+    def test_put_prunes_expired_entries(self, tmp_path, sample_result):
+        """Writing a result should delete entries older than max_age."""
+        cache = ReviewCache(str(tmp_path / "cache.db"), max_age=60)
+        cache._conn.execute(
+            "INSERT INTO review_cache (content_sha256, result_json, ts) VALUES (?, ?, ?)",
+            ("stale", sample_result.model_dump_json(), time.time() - 120)
+        )
+        
+        cache.put(ReviewCache.make_key("x = 1", "python"), sample_result)
+        
+        keys = [row[0] for row in cache._conn.execute("SELECT content_sha256 FROM review_cache")]
+        assert keys == [ReviewCache.make_key("x = 1", "python")]
+        cache.close()
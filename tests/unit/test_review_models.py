@@ -221,6 +221,26 @@ class TestReviewResultAddIssue:
         assert result.low_count == 1
         assert result.info_count == 1
         assert result.total_issues == 5
+    
+    def test_extend_issues_defers_statistics(self):
+        """Test that extend_issues adds issues and leaves statistics to update_statistics."""
+        result = ReviewResult()
+        
+        result.extend_issues([
+            ReviewIssue(severity=Severity.CRITICAL, category=IssueCategory.SECURITY, message="1"),
+            ReviewIssue(severity=Severity.LOW, category=IssueCategory.STYLE, message="2"),
+        ])
+        
+        assert len(result.issues) == 2
+        assert result.total_issues == 0
+        
+        result.update_statistics()
+        
+        assert result.total_issues == 2
+        assert result.critical_count == 1
+        assert result.low_count == 1
+        assert result.quality_score == 78.0
+        assert result.passed is False
 
 
 class TestReviewResultQueryMethods:
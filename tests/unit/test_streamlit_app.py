@@ -96,6 +96,15 @@ class TestAppUtilities:
         assert Severity.CRITICAL in color_map
         assert Severity.HIGH in color_map
         assert len(color_map) == 5  # All 5 severity levels
+    
+    def test_get_severity_color_map_returns_independent_copy(self):
+        """Mutating the returned map should not affect later calls."""
+        from src.streamlit_utils import get_severity_color_map
+        
+        color_map = get_severity_color_map()
+        color_map[Severity.CRITICAL] = "purple"
+        
+        assert get_severity_color_map()[Severity.CRITICAL] == "red"
 
 
 class TestResultFormatting:
@@ -151,6 +160,18 @@ class TestResultFormatting:
         assert IssueCategory.SECURITY in grouped
         assert IssueCategory.COMPLEXITY in grouped
         assert IssueCategory.STYLE in grouped
+    
+    def test_group_issues_matches_separate_groupings(self, sample_review_result):
+        """group_issues should return both groupings from one pass."""
+        from src.streamlit_utils import (
+            group_issues, group_issues_by_severity, group_issues_by_category
+        )
+        
+        issues = sample_review_result.issues
+        by_severity, by_category = group_issues(issues)
+        
+        assert by_severity == group_issues_by_severity(issues)
+        assert by_category == group_issues_by_category(issues)
 
 
 class TestReviewSummary:
@@ -233,6 +254,17 @@ class TestCodeValidation:
         assert is_valid is False
         assert "large" in message.lower() or "lines" in message.lower()
     
+    def test_validate_code_input_line_limit_boundary(self):
+        """validate_code_input should count lines the same way as split('\\n')."""
+        from src.streamlit_utils import validate_code_input
+        
+        assert validate_code_input("x = 1\n" * 9, max_lines=10) == (True, "")
+        
+        is_valid, message = validate_code_input("x = 1\n" * 10, max_lines=10)
+        
+        assert is_valid is False
+        assert "11 lines" in message
+    
     def test_validate_language_selection_valid(self):
         """validate_language_selection should accept supported languages."""
         from src.streamlit_utils import validate_language_selection
@@ -322,6 +354,47 @@ class TestExportFunctionality:
         assert "issues" in data
         assert "quality_score" in data
     
+    def test_export_to_json_issue_fields(self, sample_review_result):
+        """export_to_json should export each issue's fields with enum values."""
+        from src.streamlit_utils import export_to_json
+        import json
+        
+        issues = json.loads(export_to_json(sample_review_result))["issues"]
+        
+        first = sample_review_result.issues[0]
+        assert issues[0] == {
+            "severity": first.severity.value,
+            "category": first.category.value,
+            "message": first.message,
+            "line_number": first.line_number,
+            "suggestion": first.suggestion,
+            "rule_id": first.rule_id
+        }
+    
+    def test_export_to_json_uses_orjson_when_available(self, sample_review_result):
+        """export_to_json should encode with orjson when it is installed."""
+        from src.streamlit_utils import export_to_json
+        
+        mock_orjson = Mock()
+        mock_orjson.dumps.return_value = b'{"issues": []}'
+        
+        with patch('src.streamlit_utils.orjson', mock_orjson):
+            json_str = export_to_json(sample_review_result)
+        
+        assert json_str == '{"issues": []}'
+        assert mock_orjson.dumps.call_args.kwargs["option"] == mock_orjson.OPT_INDENT_2
+    
+    def test_export_to_json_falls_back_to_json(self, sample_review_result):
+        """export_to_json should use the json module when orjson is missing."""
+        from src.streamlit_utils import export_to_json
+        import json
+        
+        with patch('src.streamlit_utils.orjson', None):
+            json_str = export_to_json(sample_review_result)
+        
+        assert json_str.startswith('{\n  "issues"')
+        assert json.loads(json_str)["total_issues"] == sample_review_result.total_issues
+    
     def test_export_to_markdown(self, sample_review_result):
         """export_to_markdown should create formatted markdown."""
         from src.streamlit_utils import export_to_markdown
@@ -342,6 +415,19 @@ class TestExportFunctionality:
         assert "severity" in csv_str.lower()
         assert "category" in csv_str.lower()
         assert "message" in csv_str.lower()
+    
+    def test_export_to_csv_writes_one_row_per_issue(self, sample_review_result):
+        """export_to_csv should write a header plus one row per issue."""
+        import csv
+        from io import StringIO
+        from src.streamlit_utils import export_to_csv
+        
+        rows = list(csv.reader(StringIO(export_to_csv(sample_review_result))))
+        
+        assert len(rows) == 1 + len(sample_review_result.issues)
+        first = sample_review_result.issues[0]
+        assert rows[1][0] == first.severity.value
+        assert rows[1][3] == first.message
 
 
 class TestConfigurationHelpers:
@@ -421,6 +507,16 @@ class TestReviewModes:
         default = get_default_config()
         
         assert config == default
+    
+    def test_get_review_mode_config_returns_copy(self):
+        """Modifying a returned mode config should not affect later calls."""
+        from src.streamlit_utils import get_review_mode_config, get_default_config
+        
+        get_review_mode_config("quick")["enable_ai"] = True
+        get_default_config()["max_complexity"] = 99
+        
+        assert get_review_mode_config("quick")["enable_ai"] is False
+        assert get_review_mode_config("unknown_mode")["max_complexity"] == 10
 
 
 # ============================================================================
@@ -444,7 +540,7 @@ class TestPromptGenerationIntegration:
             line_number=42
         ))
         
-        with patch('src.streamlit_utils.PromptGenerator') as mock_generator_class:
+        with patch('src.services.prompt_generator.PromptGenerator') as mock_generator_class:
             mock_generator = Mock()
             mock_generator_class.return_value = mock_generator
             
@@ -462,7 +558,7 @@ class TestPromptGenerationIntegration:
         
         review_result = ReviewResult()  # No issues
         
-        with patch('src.streamlit_utils.PromptGenerator') as mock_generator_class:
+        with patch('src.services.prompt_generator.PromptGenerator') as mock_generator_class:
             mock_generator = Mock()
             mock_generator_class.return_value = mock_generator
             
@@ -504,7 +600,7 @@ class TestPromptGenerationIntegration:
             line_number=5
         ))
         
-        with patch('src.streamlit_utils.PromptGenerator') as mock_generator_class:
+        with patch('src.services.prompt_generator.PromptGenerator') as mock_generator_class:
             mock_generator = Mock()
             mock_generator_class.return_value = mock_generator
             
@@ -529,7 +625,7 @@ class TestPromptGenerationIntegration:
             line_number=10
         ))
         
-        with patch('src.streamlit_utils.PromptGenerator') as mock_generator_class:
+        with patch('src.services.prompt_generator.PromptGenerator') as mock_generator_class:
             mock_generator = Mock()
             mock_generator_class.return_value = mock_generator
             
@@ -541,9 +637,6 @@ class TestPromptGenerationIntegration:
             # Should return empty result, not crash
             assert isinstance(result, PromptGenerationResult)
             assert not result.has_prompts()
-
-
-class TestPromptFormattingForUI:
     
     def test_generate_copilot_prompts_uses_existing_api_key(self):
         """Should use API key from environment when available."""
@@ -558,7 +651,7 @@ class TestPromptFormattingForUI:
         ))
         
         with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
-            with patch('src.streamlit_utils.PromptGenerator') as mock_generator_class:
+            with patch('src.services.prompt_generator.PromptGenerator') as mock_generator_class:
                 mock_generator = Mock()
                 mock_generator_class.return_value = mock_generator
                 
@@ -771,6 +864,27 @@ class TestPromptExport:
         data = json.loads(json_str)
         assert "prompts" in data or isinstance(data, list)
     
+    def test_export_prompts_to_json_without_orjson(self):
+        """Should produce the same JSON when orjson is not installed."""
+        from src.streamlit_utils import export_prompts_to_json
+        from src.models.prompt_models import PromptSuggestion, PromptGenerationResult
+        import json
+        
+        result = PromptGenerationResult(language="python")
+        result.add_prompt(PromptSuggestion(
+            category=IssueCategory.STYLE,
+            prompt_text="Fix style issues",
+            issue_count=1,
+            severity_summary="1 low",
+            line_references=[4]
+        ))
+        
+        with patch('src.streamlit_utils.orjson', None):
+            fallback_str = export_prompts_to_json(result)
+        
+        assert json.loads(fallback_str) == json.loads(export_prompts_to_json(result))
+        assert json.loads(fallback_str)["prompts"][0]["category"] == "style"
+    
     def test_export_prompts_to_markdown(self):
         """Should export prompts as Markdown."""
         from src.streamlit_utils import export_prompts_to_markdown
@@ -906,6 +1020,48 @@ class TestPromptUIHelpers:
         # Style should be a neutral color
         assert get_category_color(IssueCategory.STYLE) in ["blue", "gray", "#0000ff"]
     
+    def test_multi_word_category_display_names(self):
+        """Multi-word categories should be shown with spaces in every format."""
+        from src.streamlit_utils import (
+            format_prompt_for_display, export_prompts_to_text, prepare_prompt_for_copy
+        )
+        from src.models.prompt_models import PromptSuggestion, PromptGenerationResult
+        
+        prompt = PromptSuggestion(
+            category=IssueCategory.BEST_PRACTICES,
+            prompt_text="Use context managers",
+            issue_count=1,
+            severity_summary="1 medium"
+        )
+        result = PromptGenerationResult(language="python")
+        result.add_prompt(prompt)
+        
+        assert format_prompt_for_display(prompt)["category"] == "👍 Best Practices"
+        assert "1. BEST PRACTICES" in export_prompts_to_text(result)
+        assert prepare_prompt_for_copy(prompt, include_context=True).startswith(
+            "Category: Best Practices"
+        )
+    
+    def test_category_tables_cover_every_category(self):
+        """Every IssueCategory should have an emoji, color and display name."""
+        from src.streamlit_utils import (
+            _CATEGORY_EMOJI, _CATEGORY_COLORS, _CATEGORY_TITLES,
+            _CATEGORY_UPPER, _CATEGORY_DISPLAY
+        )
+        
+        for table in (
+            _CATEGORY_EMOJI, _CATEGORY_COLORS, _CATEGORY_TITLES,
+            _CATEGORY_UPPER, _CATEGORY_DISPLAY
+        ):
+            assert set(table) == set(IssueCategory)
+    
+    def test_category_helpers_fall_back_for_unknown_values(self):
+        """Should return default emoji and color for values outside IssueCategory."""
+        from src.streamlit_utils import get_category_emoji, get_category_color
+        
+        assert get_category_emoji("not_a_category") == "📌"
+        assert get_category_color("not_a_category") == "gray"
+    
     def test_should_generate_prompts(self):
         """Should determine if prompts should be generated based on config."""
         from src.streamlit_utils import should_generate_prompts